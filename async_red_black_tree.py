@@ -0,0 +1,86 @@
+"""
+红黑树的asyncio分块操作，避免在事件循环中长时间阻塞
+每处理chunk个元素就await asyncio.sleep(0)让出一次事件循环
+"""
+import asyncio
+
+
+def _check_chunk(chunk):
+    if chunk < 1:
+        raise ValueError(f"chunk必须是正整数，得到{chunk}")
+
+
+def _successor(tree, node):
+    """返回node的中序后继，不存在时返回tree.NIL"""
+    NIL = tree.NIL
+    if node.right != NIL:
+        node = node.right
+        while node.left != NIL:
+            node = node.left
+        return node
+    parent = node.parent
+    while parent != NIL and node == parent.right:
+        node = parent
+        parent = parent.parent
+    return parent
+
+
+async def aiter_range(tree, lo=None, hi=None, chunk=1024):
+    """
+    按从小到大的顺序异步迭代满足lo <= x < hi的值，lo/hi为None表示不设界
+    每块结束后以上一个值重新定位，因此让出期间树被修改也不会失效
+    """
+    _check_chunk(chunk)
+    compare = tree.compare
+    NIL = tree.NIL
+    last = None
+    started = False
+
+    while True:
+        # 定位本块的起始节点
+        if not started:
+            if lo is None:
+                node = tree.get_by_index(0)
+            else:
+                node, _ = tree.bisect_left_node(lo)
+            started = True
+        else:
+            node, _ = tree.bisect_left_node(last)
+            if node is not None and not compare(last, node.val):
+                node = _successor(tree, node)
+        if node is None:
+            return
+
+        values = []
+        while node != NIL and len(values) < chunk:
+            if hi is not None and not compare(node.val, hi):
+                break
+            values.append(node.val)
+            node = _successor(tree, node)
+
+        for val in values:
+            yield val
+        if len(values) < chunk:
+            return
+        last = values[-1]
+        await asyncio.sleep(0)
+
+
+async def ainsert_many(tree, values, chunk=1024):
+    """分块插入values中的所有值"""
+    _check_chunk(chunk)
+    insert = tree.insert
+    for k, val in enumerate(values, 1):
+        insert(val)
+        if k % chunk == 0:
+            await asyncio.sleep(0)
+
+
+async def adelete_many(tree, values, chunk=1024):
+    """分块删除values中的所有值"""
+    _check_chunk(chunk)
+    delete = tree.delete
+    for k, val in enumerate(values, 1):
+        delete(val)
+        if k % chunk == 0:
+            await asyncio.sleep(0)
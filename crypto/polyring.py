@@ -0,0 +1,155 @@
+"""
+Polynomial ring arithmetic in Z_q[X]/(X^n + 1) using a vectorized NumPy
+number-theoretic transform (NTT).
+
+Negacyclic multiplication costs O(n log n) instead of the O(n^2) double loop
+used by PlainText::operator* in bfv.cpp. Every operation accepts arrays of
+shape (..., n) and broadcasts over the leading axes, so stacks of polynomials
+are processed in one call.
+"""
+import numpy as np
+
+
+def _is_prime(q):
+    if q < 2:
+        return False
+    if q % 2 == 0:
+        return q == 2
+    d = 3
+    while d * d <= q:
+        if q % d == 0:
+            return False
+        d += 2
+    return True
+
+
+def find_ntt_prime(n, bits=30):
+    """Return the largest prime q < 2^bits with q = 1 (mod 2n), as required by PolyRing"""
+    step = 2 * n
+    q = ((1 << bits) - 1) // step * step + 1
+    while q > step:
+        if _is_prime(q):
+            return q
+        q -= step
+    raise ValueError(f"no NTT-friendly prime below 2^{bits} for n={n}")
+
+
+class PolyRing:
+    def __init__(self, n, q):
+        """
+        n: ring degree, must be a power of two
+        q: prime modulus with q = 1 (mod 2n) and q < 2^31, so that products of
+           two residues fit in int64
+        """
+        if n < 1 or n & (n - 1):
+            raise ValueError(f"ring degree must be a power of two, got {n}")
+        if q >= 1 << 31 or not _is_prime(q) or (q - 1) % (2 * n):
+            raise ValueError(f"modulus must be a prime below 2^31 with q = 1 (mod 2n), got {q}")
+        self.n = n
+        self.q = q
+
+        # psi is a primitive 2n-th root of unity: psi^n = -1 (mod q)
+        for g in range(2, q):
+            psi = pow(g, (q - 1) // (2 * n), q)
+            if pow(psi, n, q) == q - 1:
+                break
+        psi_inv = pow(psi, q - 2, q)
+        n_inv = pow(n, q - 2, q)
+        omega = psi * psi % q
+        omega_inv = psi_inv * psi_inv % q
+
+        # Twisting by psi^i turns the negacyclic product into a cyclic one;
+        # the inverse twist also folds in the 1/n scaling of the inverse NTT
+        self._twist = self._powers(psi, n)
+        self._untwist = self._powers(psi_inv, n) * n_inv % q
+
+        log_n = n.bit_length() - 1
+        rev = np.zeros(n, dtype=np.int64)
+        for i in range(n):
+            rev[i] = int(format(i, f"0{log_n}b")[::-1], 2) if log_n else 0
+        self._bit_reverse = rev
+
+        self._stages = []
+        self._inv_stages = []
+        half = 1
+        while half < n:
+            self._stages.append((half, self._powers(pow(omega, n // (2 * half), q), half)))
+            self._inv_stages.append((half, self._powers(pow(omega_inv, n // (2 * half), q), half)))
+            half *= 2
+
+    def _powers(self, base, count):
+        result = np.empty(count, dtype=np.int64)
+        x = 1
+        for i in range(count):
+            result[i] = x
+            x = x * base % self.q
+        return result
+
+    def _as_poly(self, a):
+        """Convert to an int64 array of shape (..., n) reduced mod q, zero-padding short inputs"""
+        a = np.asarray(a, dtype=np.int64)
+        if a.ndim == 0 or a.shape[-1] > self.n:
+            raise ValueError(f"expected polynomials with at most {self.n} coefficients, got shape {a.shape}")
+        if a.shape[-1] < self.n:
+            pad = [(0, 0)] * (a.ndim - 1) + [(0, self.n - a.shape[-1])]
+            a = np.pad(a, pad)
+        return a % self.q
+
+    def _transform(self, x, stages):
+        """Iterative Cooley-Tukey butterflies over the last axis, one vectorized step per stage"""
+        q = self.q
+        lead = x.shape[:-1]
+        x = x[..., self._bit_reverse]
+        for half, twiddles in stages:
+            x = x.reshape(lead + (self.n // (2 * half), 2, half))
+            u = x[..., 0, :]
+            v = x[..., 1, :] * twiddles % q
+            x = np.stack(((u + v) % q, (u - v) % q), axis=-2)
+        return x.reshape(lead + (self.n,))
+
+    def ntt(self, a):
+        """Forward negacyclic NTT of polynomials a with shape (..., n)"""
+        a = self._as_poly(a)
+        return self._transform(a * self._twist % self.q, self._stages)
+
+    def intt(self, a_hat):
+        """Inverse of ntt()"""
+        a_hat = np.asarray(a_hat, dtype=np.int64)
+        return self._transform(a_hat, self._inv_stages) * self._untwist % self.q
+
+    def add(self, a, b):
+        """Coefficient-wise a + b mod q"""
+        return (self._as_poly(a) + self._as_poly(b)) % self.q
+
+    def sub(self, a, b):
+        """Coefficient-wise a - b mod q"""
+        return (self._as_poly(a) - self._as_poly(b)) % self.q
+
+    def neg(self, a):
+        """Coefficient-wise -a mod q"""
+        return -self._as_poly(a) % self.q
+
+    def mul(self, a, b):
+        """Product a * b in Z_q[X]/(X^n + 1), O(n log n) per polynomial"""
+        return self.intt(self.ntt(a) * self.ntt(b) % self.q)
+
+    def mul_scalar(self, a, c):
+        """Multiply every coefficient of a by the integer c mod q"""
+        return self._as_poly(a) * (c % self.q) % self.q
+
+
+if __name__ == "__main__":
+    # Same messages as the main() in bfv.cpp
+    ring = PolyRing(8, find_ntt_prime(8))
+    m1 = [1, 2, 3]  # 1 + 2X + 3X^2
+    m2 = [2, 1, 1]  # 2 + X + X^2
+    print("q =", ring.q)
+    print("m1 + m2 =", ring.add(m1, m2).tolist())
+    print("m1 * m2 =", ring.mul(m1, m2).tolist())
+
+    # Batched multiplication of a stack of degree-4096 polynomials
+    big = PolyRing(4096, find_ntt_prime(4096))
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, big.q, size=(16, big.n))
+    b = rng.integers(0, big.q, size=(16, big.n))
+    print("batched product shape:", big.mul(a, b).shape)
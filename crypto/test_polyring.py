@@ -0,0 +1,58 @@
+import numpy as np
+
+from polyring import PolyRing, find_ntt_prime
+
+
+def negacyclic_mul(a, b, q):
+    """Naive O(n^2) product as in bfv.cpp, reduced mod X^n + 1"""
+    n = len(a)
+    result = [0] * n
+    for i in range(n):
+        for j in range(n):
+            if i + j < n:
+                result[i + j] += a[i] * b[j]
+            else:
+                result[i + j - n] -= a[i] * b[j]
+    return [x % q for x in result]
+
+
+def test_polyring_mul():
+    rng = np.random.default_rng(1)
+    for n in [1, 2, 8, 64]:
+        ring = PolyRing(n, find_ntt_prime(n))
+        a = rng.integers(0, ring.q, size=n)
+        b = rng.integers(0, ring.q, size=n)
+        assert ring.mul(a, b).tolist() == negacyclic_mul(a.tolist(), b.tolist(), ring.q)
+        assert ring.intt(ring.ntt(a)).tolist() == a.tolist()
+
+    # X^(n-1) * X = X^n = -1
+    ring = PolyRing(8, 17)
+    x_top = [0] * 7 + [1]
+    assert ring.mul(x_top, [0, 1]).tolist() == [16, 0, 0, 0, 0, 0, 0, 0]
+    # Matches m1 * m2 from bfv.cpp (no wrap-around below degree n)
+    ring = PolyRing(8, find_ntt_prime(8))
+    assert ring.mul([1, 2, 3], [2, 1, 1]).tolist() == [2, 5, 9, 5, 3, 0, 0, 0]
+
+
+def test_polyring_batched():
+    rng = np.random.default_rng(2)
+    ring = PolyRing(32, find_ntt_prime(32, bits=20))
+    a = rng.integers(0, ring.q, size=(3, 4, 32))
+    b = rng.integers(0, ring.q, size=(4, 32))
+    product = ring.mul(a, b)
+    assert product.shape == (3, 4, 32)
+    for i in range(3):
+        for j in range(4):
+            assert product[i, j].tolist() == negacyclic_mul(a[i, j].tolist(), b[j].tolist(), ring.q)
+    assert (ring.sub(ring.add(a, b), b) == a).all()
+    assert (ring.add(a, ring.neg(a)) == 0).all()
+    assert (ring.mul_scalar(a, -1) == ring.neg(a)).all()
+
+
+def test_polyring_invalid_params():
+    for n, q in [(6, 13), (8, 19), (8, 15)]:
+        try:
+            PolyRing(n, q)
+        except ValueError:
+            continue
+        assert False, f"PolyRing({n}, {q}) should raise ValueError"
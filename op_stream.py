@@ -0,0 +1,73 @@
+"""
+算法竞赛风格的操作流处理器，一次性读入全部输入并缓冲全部输出
+输入格式：第一行为操作数n，之后n行每行两个整数"op x"
+    op = 1: 插入x
+    op = 2: 删除x
+    op = 3: 查询第x小的元素（0-indexed），不存在输出-1
+    op = 4: 查询第一个>=x的元素及其下标，不存在输出"-1 总节点数"
+用法：python op_stream.py < input.txt
+"""
+import sys
+
+from red_black_tree_template import RedBlackTree
+
+OP_INSERT = 1
+OP_DELETE = 2
+OP_QUERY_INDEX = 3
+OP_QUERY_BISECT = 4
+
+
+def run_ops(stream=None, out=None, tree=None):
+    """
+    从二进制流stream读取操作并执行，所有答案最后一次性写入out
+    stream默认为sys.stdin.buffer，out默认为sys.stdout.buffer
+    返回执行操作所用的红黑树
+    """
+    if stream is None:
+        stream = sys.stdin.buffer
+    if out is None:
+        out = sys.stdout.buffer
+    if tree is None:
+        tree = RedBlackTree()
+
+    data = list(map(int, stream.read().split()))
+    if not data:
+        # 空输入视为0个操作
+        out.flush()
+        return tree
+    n = data[0]
+    if len(data) < 2 * n + 1:
+        raise ValueError(f"输入声明了{n}个操作，但只包含{(len(data) - 1) // 2}个完整的操作")
+
+    # 绑定到局部变量，避免循环中重复的属性查找
+    insert = tree.insert
+    delete = tree.delete
+    get_by_index = tree.get_by_index
+    bisect_left_node = tree.bisect_left_node
+    answers = []
+    append = answers.append
+
+    for k in range(1, 2 * n + 1, 2):
+        op = data[k]
+        x = data[k + 1]
+        if op == OP_INSERT:
+            insert(x)
+        elif op == OP_DELETE:
+            delete(x)
+        elif op == OP_QUERY_INDEX:
+            node = get_by_index(x)
+            append(str(node.val) if node is not None else "-1")
+        elif op == OP_QUERY_BISECT:
+            node, idx = bisect_left_node(x)
+            append(f"{node.val} {idx}" if node is not None else f"-1 {idx}")
+        else:
+            raise ValueError(f"第{(k + 1) // 2}个操作的操作码{op}无效")
+
+    if answers:
+        out.write(("\n".join(answers) + "\n").encode())
+    out.flush()
+    return tree
+
+
+if __name__ == "__main__":
+    run_ops()
@@ -27,6 +27,8 @@ class RedBlackTree:
         self.NIL.node_count = 0
         
         self.root = self.NIL
+        # 最大节点的指针，用于单调递增插入的快速路径
+        self.max_node = self.NIL
 
     def _update_node_count(self, node):
         """更新节点的node_count值"""
@@ -82,7 +84,10 @@ class RedBlackTree:
         self._update_node_count(x)
 
     def _fix_insert(self, node):
-        """修复插入后可能导致的红黑树性质破坏"""
+        """
+        修复插入后可能导致的红黑树性质破坏
+        返回值：根节点是否由红染黑（即整棵树的黑高加1）
+        """
         while node.parent.isred:
             if node.parent == node.parent.parent.left:
                 uncle = node.parent.parent.right
@@ -123,7 +128,9 @@ class RedBlackTree:
                     node.parent.parent.isred = True
                     self._rotate_left(node.parent.parent)
         
+        grew = self.root.isred
         self.root.isred = False
+        return grew
 
     def insert(self, val):
         """插入值val"""
@@ -132,6 +139,22 @@ class RedBlackTree:
         node.right = self.NIL
         node.node_count = 1
         
+        # 快速路径：比当前最大值还大时直接挂在最大节点的右侧，省去从根开始的查找
+        max_node = self.max_node
+        if max_node != self.NIL and self.compare(max_node.val, val):
+            node.parent = max_node
+            max_node.right = node
+            self.max_node = node
+            
+            # 只需更新右链上祖先的node_count
+            temp = max_node
+            while temp != self.NIL:
+                temp.node_count += 1
+                temp = temp.parent
+            
+            self._fix_insert(node)
+            return
+        
         parent = self.NIL
         current = self.root
         
@@ -149,6 +172,7 @@ class RedBlackTree:
         
         if parent == self.NIL:
             self.root = node
+            self.max_node = node
         elif self.compare(val, parent.val):
             parent.left = node
         else:
@@ -238,6 +262,18 @@ class RedBlackTree:
         z = self.search_node(val)
         if z == self.NIL:
             return  # 值不存在
+        self._delete_node(z)
+
+    def _delete_node(self, z):
+        """从树中删除节点z（z必须在树中）"""
+        if z == self.max_node:
+            # 最大节点没有右孩子，新的最大节点是它左子树的最大节点或者它的父节点
+            if z.left != self.NIL:
+                self.max_node = z.left
+                while self.max_node.right != self.NIL:
+                    self.max_node = self.max_node.right
+            else:
+                self.max_node = z.parent
         
         y = z
         y_original_isred = y.isred
@@ -364,6 +400,32 @@ class RedBlackTree:
         
         return None  # 理论上不会到达这里
 
+    def build_from_sorted(self, values):
+        """
+        用已排序且无重复的序列在O(n)时间内重建整棵树（覆盖原有内容）
+        最深一层的节点染红，其余染黑，保证满足红黑树性质
+        """
+        n = len(values)
+        # 黑高为floor(log2(n+1))，深度不小于黑高的节点都在最底层
+        black_height = (n + 1).bit_length() - 1
+        NIL = self.NIL
+
+        def build_helper(lo, hi, depth, parent):
+            if lo >= hi:
+                return NIL
+            mid = (lo + hi) // 2
+            node = RedBlackTreeNode(values[mid], depth >= black_height)
+            node.parent = parent
+            node.left = build_helper(lo, mid, depth + 1, node)
+            node.right = build_helper(mid + 1, hi, depth + 1, node)
+            node.node_count = hi - lo
+            return node
+
+        self.root = build_helper(0, n, 0, NIL)
+        self.max_node = self.root
+        while self.max_node.right != NIL:
+            self.max_node = self.max_node.right
+
     def size(self):
         """返回树中节点总数"""
         return self.root.node_count if self.root != self.NIL else 0
@@ -0,0 +1,244 @@
+"""
+隐式键红黑树：元素按位置而不是按值排序，可作为支持O(log n)中间插入/删除的列表
+复用RedBlackTree的旋转、插入修复和删除修复逻辑，node_count即为位置索引
+"""
+from red_black_tree_template import RedBlackTree, RedBlackTreeNode
+
+
+def _make_nil():
+    nil = RedBlackTreeNode(None, False)
+    nil.left = nil
+    nil.right = nil
+    nil.parent = nil
+    nil.node_count = 0
+    return nil
+
+
+class SequenceTree(RedBlackTree):
+    # 所有SequenceTree共用同一个哨兵节点，concat/split_at时节点可以直接在树之间移动
+    _SHARED_NIL = _make_nil()
+
+    def __init__(self, values=()):
+        super().__init__()
+        self.NIL = self._SHARED_NIL
+        self.root = self.NIL
+        values = list(values)
+        if values:
+            self.build_from_sorted(values)
+        # 按位置插入不走按值的快速路径，max_node始终保持为NIL
+        self.max_node = self.NIL
+
+    def _new_node(self, val):
+        node = RedBlackTreeNode(val, True)
+        node.left = self.NIL
+        node.right = self.NIL
+        node.parent = self.NIL
+        return node
+
+    def insert_at(self, i, val):
+        """在位置i之前插入val，i超出范围时与list.insert一样截断到[0, size]"""
+        n = self.size()
+        if i < 0:
+            i = max(i + n, 0)
+        i = min(i, n)
+
+        node = self._new_node(val)
+        if self.root == self.NIL:
+            self.root = node
+        elif i == n:
+            # 挂到最右节点的右侧
+            parent = self.root
+            while parent.right != self.NIL:
+                parent = parent.right
+            parent.right = node
+            node.parent = parent
+        else:
+            # 挂到原第i个节点的前驱位置
+            parent = self.get_by_index(i)
+            if parent.left == self.NIL:
+                parent.left = node
+            else:
+                parent = parent.left
+                while parent.right != self.NIL:
+                    parent = parent.right
+                parent.right = node
+            node.parent = parent
+
+        temp = node.parent
+        while temp != self.NIL:
+            self._update_node_count(temp)
+            temp = temp.parent
+
+        self._fix_insert(node)
+
+    def append(self, val):
+        """在末尾插入val"""
+        self.insert_at(self.size(), val)
+
+    def _node_at(self, i):
+        """返回位置i的节点，负数i与list一样从末尾计数，超出范围时返回None"""
+        if i < 0:
+            i += self.size()
+        return self.get_by_index(i)
+
+    def delete_at(self, i):
+        """
+        删除位置i的元素，负数i从末尾计数
+        返回值：被删除的值或None（如果索引超出范围）
+        """
+        node = self._node_at(i)
+        if node is None:
+            return None
+        self._delete_node(node)
+        return node.val
+
+    def move(self, i, j):
+        """把位置i的元素移动到位置j（等价于seq.insert(j, seq.pop(i))）"""
+        node = self._node_at(i)
+        if node is None:
+            return
+        self._delete_node(node)
+        self.insert_at(j, node.val)
+
+    def _black_height(self, node):
+        """沿最左路径统计黑色节点数（不含NIL）"""
+        h = 0
+        while node != self.NIL:
+            if not node.isred:
+                h += 1
+            node = node.left
+        return h
+
+    def _join(self, a, ha, k, b, hb):
+        """
+        以k为中间节点连接根为a和b的两棵子树（a中所有元素在b之前）
+        ha、hb为a、b的黑高（到NIL路径上的黑色节点数，含根），a、b、k必须已从原父节点上摘下
+        返回值：(新的根, 新的黑高)，时间复杂度O(|ha - hb| + 1)
+        """
+        NIL = self.NIL
+        # 根节点统一染黑，红根染黑后黑高加1
+        if a.isred:
+            a.isred = False
+            ha += 1
+        if b.isred:
+            b.isred = False
+            hb += 1
+        k.isred = True
+
+        if ha == hb:
+            k.left = a
+            k.right = b
+            k.parent = NIL
+            if a != NIL:
+                a.parent = k
+            if b != NIL:
+                b.parent = k
+            k.isred = False
+            self._update_node_count(k)
+            self.root = k
+            return k, ha + 1
+
+        if ha > hb:
+            # 沿a的右链向下找到黑高等于hb的黑色节点c，用k替换它
+            self.root = a
+            c, h = a, ha
+            while c.isred or h > hb:
+                if not c.isred:
+                    h -= 1
+                p, c = c, c.right
+            p.right = k
+            k.left = c
+            k.right = b
+        else:
+            # 沿b的左链向下找到黑高等于ha的黑色节点c，用k替换它
+            self.root = b
+            c, h = b, hb
+            while c.isred or h > ha:
+                if not c.isred:
+                    h -= 1
+                p, c = c, c.left
+            p.left = k
+            k.left = a
+            k.right = c
+        k.parent = p
+        if k.left != NIL:
+            k.left.parent = k
+        if k.right != NIL:
+            k.right.parent = k
+
+        temp = k
+        while temp != NIL:
+            self._update_node_count(temp)
+            temp = temp.parent
+
+        grew = self._fix_insert(k)
+        return self.root, max(ha, hb) + (1 if grew else 0)
+
+    def concat(self, other):
+        """把other的所有元素接到末尾，other随后变为空树"""
+        if other is self:
+            raise ValueError("不能把SequenceTree拼接到自身")
+        if other.root == self.NIL:
+            return
+        mid = other.delete_at(0)
+        self._join(self.root, self._black_height(self.root), self._new_node(mid),
+                   other.root, self._black_height(other.root))
+        other.root = other.NIL
+
+    def split_at(self, i):
+        """
+        在位置i处切分：自身保留前i个元素，返回包含其余元素的新SequenceTree
+        沿根到位置i的路径拆出的各子树黑高单调，各次join的代价相加为O(log n)
+        """
+        NIL = self.NIL
+        n = self.size()
+        if i < 0:
+            i = max(i + n, 0)
+        i = min(i, n)
+
+        def split_helper(t, ht, i):
+            """ht为t的黑高，返回(左根, 左黑高, 右根, 右黑高)"""
+            if t == NIL:
+                return NIL, 0, NIL, 0
+            l, r = t.left, t.right
+            hc = ht - (0 if t.isred else 1)
+            if l != NIL:
+                l.parent = NIL
+            if r != NIL:
+                r.parent = NIL
+            t.left = NIL
+            t.right = NIL
+            t.parent = NIL
+            t.node_count = 1
+
+            if i <= l.node_count:
+                left, hl, right, hr = split_helper(l, hc, i)
+                right, hr = self._join(right, hr, t, r, hc)
+                return left, hl, right, hr
+            left, hl, right, hr = split_helper(r, hc, i - l.node_count - 1)
+            left, hl = self._join(l, hc, t, left, hl)
+            return left, hl, right, hr
+
+        left, _, right, _ = split_helper(self.root, self._black_height(self.root), i)
+        left.isred = False
+        right.isred = False
+        self.root = left
+        other = SequenceTree()
+        other.root = right
+        return other
+
+    # 以下按值比较的操作对隐式键没有意义
+    def insert(self, val):
+        raise TypeError("SequenceTree按位置插入，请使用insert_at或append")
+
+    def delete(self, val):
+        raise TypeError("SequenceTree按位置删除，请使用delete_at")
+
+    def search_node(self, val):
+        raise TypeError("SequenceTree不按值排序，无法按值查找")
+
+    def search(self, val):
+        raise TypeError("SequenceTree不按值排序，无法按值查找")
+
+    def bisect_left_node(self, t):
+        raise TypeError("SequenceTree不按值排序，无法二分查找")
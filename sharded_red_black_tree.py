@@ -0,0 +1,221 @@
+"""
+按键值区间分片的红黑树，适用于超大数据集
+用抽样得到的分割点把键空间划分为若干区间，每个区间维护一棵独立的红黑树，
+全局排名由各分片size()的前缀和得到；批量构建时各分片的排序可以交给进程池完成
+"""
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import cmp_to_key
+import random
+
+from red_black_tree_template import RedBlackTree
+
+
+def _default_compare(a, b):
+    return a < b
+
+
+def _sort_key(compare_func):
+    """把compare_func转换为sorted使用的key，默认比较时返回None直接使用自然顺序"""
+    if compare_func is None:
+        return None
+    return cmp_to_key(
+        lambda a, b: -1 if compare_func(a, b) else (1 if compare_func(b, a) else 0))
+
+
+def _sort_shard(values, compare_func):
+    """对一个分片排序并去重（相等的值只保留一个，与insert的行为一致）"""
+    values = sorted(values, key=_sort_key(compare_func))
+    if compare_func is None:
+        compare_func = _default_compare
+    result = []
+    for val in values:
+        if not result or compare_func(result[-1], val):
+            result.append(val)
+    return result
+
+
+class ShardedRedBlackTree:
+    def __init__(self, values=(), num_shards=4, compare_func=None,
+                 max_workers=1, sample_size=1024):
+        """
+        values: 初始数据，会被抽样确定分割点并批量构建
+        num_shards: 分片数量
+        compare_func: 比较函数；并行构建时需要能被pickle（模块级函数），默认为a < b
+        max_workers: 进程池大小，默认为1即在当前进程内串行构建；
+                     数据需要pickle往返，只有比较函数很慢且有多核时并行才划算
+        sample_size: 每个分片用于确定分割点的抽样数量
+        """
+        self._compare_func = compare_func
+        self.compare = compare_func if compare_func is not None else _default_compare
+        self.max_workers = max_workers
+        self.splits = []  # 长度为num_shards-1的分割点，第k个分片包含splits[k-1] <= x < splits[k]
+        self.shards = [RedBlackTree(compare_func)]
+        self._prefix = None  # 各分片大小的前缀和，修改后置为None惰性重算
+
+        # 没有数据可供抽样时无法划分区间，只使用一个分片
+        values = list(values)
+        if values:
+            self._choose_splits(values, num_shards, sample_size)
+            self._bulk_build(values)
+
+    def _choose_splits(self, values, num_shards, sample_size):
+        """从数据中抽样，取等距分位点作为分割点"""
+        sample = random.sample(values, min(len(values), sample_size * num_shards))
+        sample = _sort_shard(sample, self._compare_func)
+        splits = []
+        for k in range(1, num_shards):
+            s = sample[k * len(sample) // num_shards]
+            if not splits or self.compare(splits[-1], s):
+                splits.append(s)
+        self.splits = splits
+        self.shards = [RedBlackTree(self._compare_func) for _ in range(len(splits) + 1)]
+
+    def _shard_of(self, val):
+        """返回val所属分片的编号，即满足splits[k] <= val的分割点个数"""
+        lo, hi = 0, len(self.splits)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.compare(val, self.splits[mid]):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def _bulk_build(self, values):
+        """按分片划分数据，排序后在各分片内O(n)建树"""
+        buckets = [[] for _ in self.shards]
+        if self._compare_func is None:
+            # 默认比较时用C实现的bisect定位分片
+            splits = self.splits
+            for val in values:
+                buckets[bisect_right(splits, val)].append(val)
+        else:
+            for val in values:
+                buckets[self._shard_of(val)].append(val)
+
+        if self.max_workers == 1 or len(buckets) == 1:
+            sorted_buckets = [_sort_shard(b, self._compare_func) for b in buckets]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                sorted_buckets = list(executor.map(
+                    _sort_shard, buckets, [self._compare_func] * len(buckets)))
+
+        for tree, bucket in zip(self.shards, sorted_buckets):
+            tree.build_from_sorted(bucket)
+        self._prefix = None
+
+    def _prefix_sums(self):
+        """返回各分片大小的前缀和，prefix[k]为前k个分片的节点总数"""
+        if self._prefix is None:
+            prefix = [0]
+            for tree in self.shards:
+                prefix.append(prefix[-1] + tree.size())
+            self._prefix = prefix
+        return self._prefix
+
+    def insert(self, val):
+        """插入值val"""
+        self.shards[self._shard_of(val)].insert(val)
+        self._prefix = None
+
+    def delete(self, val):
+        """删除值为val的节点"""
+        self.shards[self._shard_of(val)].delete(val)
+        self._prefix = None
+
+    def search(self, val):
+        """查找值是否存在"""
+        return self.shards[self._shard_of(val)].search(val)
+
+    def size(self):
+        """返回所有分片的节点总数"""
+        return self._prefix_sums()[-1]
+
+    def get_by_index(self, i):
+        """
+        获取从小到大第i个节点（0-indexed）
+        返回值：节点对象或None（如果索引超出范围）
+        """
+        prefix = self._prefix_sums()
+        if i < 0 or i >= prefix[-1]:
+            return None
+        # 找到满足prefix[k] <= i < prefix[k+1]的分片k
+        lo, hi = 0, len(self.shards)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if prefix[mid + 1] <= i:
+                lo = mid + 1
+            else:
+                hi = mid
+        return self.shards[lo].get_by_index(i - prefix[lo])
+
+    def bisect_left_node(self, t):
+        """
+        搜索值大于等于t的节点以及全局下标
+        返回值：(节点, 下标) 或 (None, 总节点数) 如果没有找到大于等于t的节点
+        """
+        prefix = self._prefix_sums()
+        k = self._shard_of(t)
+        node, idx = self.shards[k].bisect_left_node(t)
+        if node is not None:
+            return node, prefix[k] + idx
+        # 当前分片内没有>=t的值，答案是后面第一个非空分片的最小值
+        for j in range(k + 1, len(self.shards)):
+            if self.shards[j].size():
+                return self.shards[j].get_by_index(0), prefix[j]
+        return None, prefix[-1]
+
+    def get_by_index_batch(self, indices):
+        """批量get_by_index，按分片分组后逐分片查询，返回与indices顺序一致的节点列表"""
+        prefix = self._prefix_sums()
+        result = [None] * len(indices)
+        order = sorted(range(len(indices)), key=indices.__getitem__)
+        k = 0
+        for pos in order:
+            i = indices[pos]
+            if i < 0 or i >= prefix[-1]:
+                continue
+            while prefix[k + 1] <= i:
+                k += 1
+            result[pos] = self.shards[k].get_by_index(i - prefix[k])
+        return result
+
+    def bisect_left_batch(self, ts):
+        """
+        批量bisect_left_node，先对查询排序，再从左到右逐分片处理
+        返回与ts顺序一致的(节点, 下标)列表
+        """
+        prefix = self._prefix_sums()
+        num_shards = len(self.shards)
+        # next_nonempty[k]为编号>=k的第一个非空分片，不存在时为num_shards
+        next_nonempty = [num_shards] * (num_shards + 1)
+        for k in range(num_shards - 1, -1, -1):
+            next_nonempty[k] = k if self.shards[k].size() else next_nonempty[k + 1]
+
+        key = _sort_key(self._compare_func)
+        order = sorted(range(len(ts)), key=(lambda p: key(ts[p])) if key else ts.__getitem__)
+        result = [None] * len(ts)
+        k = 0
+        for pos in order:
+            t = ts[pos]
+            while k < len(self.splits) and not self.compare(t, self.splits[k]):
+                k += 1
+            node, idx = self.shards[k].bisect_left_node(t)
+            if node is not None:
+                result[pos] = (node, prefix[k] + idx)
+                continue
+            # 当前分片内没有>=t的值，答案是后面第一个非空分片的最小值
+            j = next_nonempty[k + 1]
+            if j < num_shards:
+                result[pos] = (self.shards[j].get_by_index(0), prefix[j])
+            else:
+                result[pos] = (None, prefix[-1])
+        return result
+
+    def inorder_traversal(self):
+        """中序遍历，返回值列表"""
+        result = []
+        for tree in self.shards:
+            result.extend(tree.inorder_traversal())
+        return result
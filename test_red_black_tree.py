@@ -1,4 +1,8 @@
 from red_black_tree_template import RedBlackTree
+from sharded_red_black_tree import ShardedRedBlackTree
+from op_stream import run_ops
+from async_red_black_tree import aiter_range, ainsert_many, adelete_many
+from sequence_tree import SequenceTree
 
 def test_basic_operations():
     print("=== 测试基本操作 ===")
@@ -87,6 +91,190 @@ def test_edge_cases():
     print(f"删除后树大小: {rbt.size()}")
     print(f"bisect_left_node(5) on empty: {rbt.bisect_left_node(5)}")
 
+def test_sharded_tree():
+    print("\n=== 测试分片红黑树 ===")
+    import random
+
+    values = random.sample(range(100000), 5000)
+    srbt = ShardedRedBlackTree(values, num_shards=4, sample_size=64)
+    rbt = RedBlackTree()
+    for val in values:
+        rbt.insert(val)
+    print(f"分片数: {len(srbt.shards)}, 各分片大小: {[t.size() for t in srbt.shards]}")
+
+    assert srbt.size() == rbt.size()
+    assert srbt.inorder_traversal() == rbt.inorder_traversal()
+    for i in [-1, 0, 1, 2499, 4999, 5000]:
+        a, b = srbt.get_by_index(i), rbt.get_by_index(i)
+        assert (a.val if a else None) == (b.val if b else None)
+    for t in [-5, 0, 777, 50000, 99999, 100000]:
+        (a, ai), (b, bi) = srbt.bisect_left_node(t), rbt.bisect_left_node(t)
+        assert (a.val if a else None, ai) == (b.val if b else None, bi)
+
+    indices = [4999, 0, 1234, 5000]
+    assert [n.val if n else None for n in srbt.get_by_index_batch(indices)] == \
+        [rbt.get_by_index(i).val if i < 5000 else None for i in indices]
+
+    ts = [99999, -5, 777, 100000, 0, 50000]
+    assert [(n.val if n else None, i) for n, i in srbt.bisect_left_batch(ts)] == \
+        [(n.val if n else None, i) for n, i in (rbt.bisect_left_node(t) for t in ts)]
+
+    # 自定义比较函数（降序）
+    desc = ShardedRedBlackTree(values, num_shards=3, compare_func=lambda a, b: a > b,
+                               sample_size=32)
+    assert desc.inorder_traversal() == sorted(values, reverse=True)
+    assert [i for _, i in desc.bisect_left_batch([100000, -1, values[0]])] == \
+        [0, 5000, sorted(values, reverse=True).index(values[0])]
+
+    # 修改后前缀和需要重新计算
+    srbt.insert(-1)
+    srbt.delete(values[0])
+    assert srbt.get_by_index(0).val == -1
+    assert srbt.size() == 5000
+    assert not srbt.search(values[0])
+
+def test_run_ops():
+    print("\n=== 测试操作流处理 ===")
+    import io
+
+    # 与comprehensive_test中算法竞赛场景相同的操作序列
+    data = b"10\n1 10\n1 5\n1 15\n1 3\n1 7\n3 2\n4 6\n2 5\n3 2\n4 6\n"
+    out = io.BytesIO()
+    tree = run_ops(io.BytesIO(data), out)
+    print(out.getvalue().decode())
+    assert out.getvalue() == b"7\n7 2\n10\n7 1\n"
+    assert tree.inorder_traversal() == [3, 7, 10, 15]
+
+    out = io.BytesIO()
+    run_ops(io.BytesIO(b"3\n3 0\n4 1\n1 1\n"), out)
+    assert out.getvalue() == b"-1\n-1 0\n"
+
+    # 空输入视为0个操作
+    out = io.BytesIO()
+    run_ops(io.BytesIO(b""), out)
+    assert out.getvalue() == b""
+
+    # 操作数不足或操作码无效时应报错
+    for bad in (b"2\n1 5\n", b"1\n9 5\n"):
+        try:
+            run_ops(io.BytesIO(bad), io.BytesIO())
+        except ValueError as e:
+            print(f"输入{bad!r}: {e}")
+            continue
+        assert False, "应该抛出ValueError"
+
+def test_async_operations():
+    print("\n=== 测试异步分块操作 ===")
+    import asyncio
+
+    async def scenario():
+        rbt = RedBlackTree()
+        await ainsert_many(rbt, range(0, 1000, 2), chunk=64)
+        assert rbt.size() == 500
+
+        result = [x async for x in aiter_range(rbt, 101, 301, chunk=16)]
+        assert result == list(range(102, 301, 2))
+        assert [x async for x in aiter_range(rbt, chunk=7)] == rbt.inorder_traversal()
+
+        # 迭代过程中删除后面的值，恢复迭代时应该跳过它们
+        seen = []
+        async for x in aiter_range(rbt, 0, 100, chunk=10):
+            seen.append(x)
+            if x == 18:
+                for v in range(20, 40, 2):
+                    rbt.delete(v)
+        assert seen == list(range(0, 20, 2)) + list(range(40, 100, 2))
+
+        await adelete_many(rbt, range(0, 1000), chunk=64)
+        assert rbt.size() == 0
+        assert [x async for x in aiter_range(rbt)] == []
+
+        for bad in (lambda: ainsert_many(rbt, [1], chunk=0),
+                    lambda: adelete_many(rbt, [1], chunk=0),
+                    lambda: aiter_range(rbt, chunk=0).__anext__()):
+            try:
+                await bad()
+            except ValueError:
+                continue
+            assert False, "chunk为0时应该抛出ValueError"
+
+    asyncio.run(scenario())
+
+def test_sequence_tree():
+    print("\n=== 测试隐式键序列树 ===")
+    seq = SequenceTree(["a", "b", "c"])
+    ref = ["a", "b", "c"]
+
+    seq.insert_at(1, "x")
+    ref.insert(1, "x")
+    seq.insert_at(100, "y")
+    ref.insert(100, "y")
+    seq.insert_at(0, "z")
+    ref.insert(0, "z")
+    print(f"插入后: {seq.inorder_traversal()}")
+    assert seq.inorder_traversal() == ref
+
+    assert seq.delete_at(2) == ref.pop(2)
+    assert seq.delete_at(10) is None
+    seq.move(0, 3)
+    ref.insert(3, ref.pop(0))
+    assert seq.inorder_traversal() == ref
+    assert seq.get_by_index(1).val == ref[1]
+
+    for i in range(seq.size() + 1):
+        tail = seq.split_at(i)
+        assert seq.inorder_traversal() == ref[:i]
+        assert tail.inorder_traversal() == ref[i:]
+        seq.concat(tail)
+        assert tail.size() == 0
+        assert seq.inorder_traversal() == ref
+
+    # 负数下标与list一致
+    assert seq.delete_at(-1) == ref.pop(-1)
+    seq.move(-1, 0)
+    ref.insert(0, ref.pop(-1))
+    assert seq.inorder_traversal() == ref
+
+    # 按值的操作和拼接自身都应报错
+    for bad in (lambda: seq.insert("q"), lambda: seq.search("a"), lambda: seq.concat(seq)):
+        try:
+            bad()
+        except (TypeError, ValueError):
+            continue
+        assert False, "应该抛出异常"
+    assert seq.inorder_traversal() == ref
+
+    # 长度差别很大的两棵树拼接
+    big = SequenceTree(range(1000))
+    big.concat(SequenceTree([1000, 1001]))
+    small = SequenceTree([-1])
+    small.concat(big)
+    assert small.inorder_traversal() == list(range(-1, 1002))
+    assert small.get_by_index(500).val == 499
+
+def test_monotonic_insert():
+    print("\n=== 测试单调递增插入 ===")
+    rbt = RedBlackTree()
+    for i in range(1000):
+        rbt.insert(i)
+        assert rbt.max_node.val == i
+    assert rbt.inorder_traversal() == list(range(1000))
+    assert rbt.get_by_index(777).val == 777
+
+    # 删除最大值后，快速路径应使用新的最大节点
+    rbt.delete(999)
+    rbt.delete(998)
+    assert rbt.max_node.val == 997
+    rbt.insert(998.5)
+    rbt.insert(500.5)
+    assert rbt.max_node.val == 998.5
+    assert rbt.size() == 1000
+    assert rbt.bisect_left_node(998) == (rbt.max_node, 999)
+
+    # 重复插入最大值不应产生重复节点
+    rbt.insert(998.5)
+    assert rbt.size() == 1000
+
 def performance_test():
     print("\n=== 性能测试 ===")
     import time
@@ -125,5 +313,10 @@ if __name__ == "__main__":
     test_bisect_left_node()
     test_deletion()
     test_edge_cases()
+    test_sharded_tree()
+    test_run_ops()
+    test_async_operations()
+    test_sequence_tree()
+    test_monotonic_insert()
     performance_test()
     print("\n所有测试通过！")
\ No newline at end of file